@@ -2,18 +2,19 @@
 Cacao Pandas UI - A pandas DataFrame table UI viewer built on Cacao.
 """
 
-from .viewer import (
-    preview_dataframe, 
-    PandasTablePage, 
-    create_simple_table, 
-    create_advanced_table,
-    preview_dataframe as preview
-)
-
 __all__ = [
     'preview_dataframe', 
     'preview', 
     'PandasTablePage',
     'create_simple_table',
     'create_advanced_table'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Import the viewer (and with it pandas and cacao) on first use, so the
+    # CLI can parse arguments without paying for those imports
+    if name in __all__:
+        from . import viewer
+        return getattr(viewer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,18 +3,91 @@ Command Line Interface for Cacao Pandas UI
 """
 import sys
 import argparse
-import pandas as pd
 from pathlib import Path
-from cacao import App
-from cacao_pandas_ui.viewer import PandasTablePage
 
+ENGINES = ["pandas", "pyarrow", "polars"]
 
-def load_dataframe_from_file(filepath, **kwargs):
+
+def _read_csv_with_engine(filepath, engine, delimiter=",", encoding="utf-8", header=0):
+    """
+    Read a CSV file with pyarrow or polars and convert it to pandas.
+    
+    Args:
+        filepath: Path to the CSV file
+        engine: "pyarrow" or "polars"
+        delimiter: Field delimiter (default: ',')
+        encoding: File encoding (default: utf-8)
+        header: Row number to use as column names, or None (default: 0)
+        
+    Returns:
+        pandas.DataFrame: Loaded DataFrame with Arrow-backed columns
+    """
+    import pandas as pd
+    
+    skip_rows = header or 0
+    if engine == "pyarrow":
+        from pyarrow import csv
+        
+        table = csv.read_csv(
+            filepath,
+            read_options=csv.ReadOptions(
+                encoding=encoding,
+                skip_rows=skip_rows,
+                autogenerate_column_names=header is None
+            ),
+            parse_options=csv.ParseOptions(delimiter=delimiter),
+            # Read empty string fields as missing, as pandas and polars do
+            convert_options=csv.ConvertOptions(strings_can_be_null=True)
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    
+    import polars as pl
+    
+    # polars decodes utf8 natively but spells it without the dash
+    if encoding.lower().replace("-", "") == "utf8":
+        encoding = "utf8"
+    frame = pl.read_csv(
+        filepath,
+        separator=delimiter,
+        encoding=encoding,
+        skip_rows=skip_rows,
+        has_header=header is not None
+    )
+    return frame.to_pandas(use_pyarrow_extension_array=True)
+
+
+def _read_parquet_with_engine(filepath, engine):
+    """
+    Read a Parquet file with pyarrow or polars and convert it to pandas.
+    
+    Args:
+        filepath: Path to the Parquet file
+        engine: "pyarrow" or "polars"
+        
+    Returns:
+        pandas.DataFrame: Loaded DataFrame with Arrow-backed columns
+    """
+    import pandas as pd
+    
+    if engine == "pyarrow":
+        import pyarrow.parquet as pq
+        
+        return pq.read_table(filepath).to_pandas(types_mapper=pd.ArrowDtype)
+    
+    import polars as pl
+    
+    return pl.read_parquet(filepath).to_pandas(use_pyarrow_extension_array=True)
+
+
+def load_dataframe_from_file(filepath, engine="pandas", **kwargs):
     """
     Load a DataFrame from various file formats.
     
     Args:
         filepath: Path to the data file
+        engine: Reader for CSV and Parquet files - "pandas", "pyarrow" or
+            "polars" (default: "pandas"). pyarrow and polars decode on multiple
+            cores and return Arrow-backed columns; other formats always use pandas.
         **kwargs: Additional arguments for pandas read functions
         
     Returns:
@@ -24,16 +97,25 @@ def load_dataframe_from_file(filepath, **kwargs):
         ValueError: If file format is not supported
         Exception: If file cannot be read
     """
+    import pandas as pd
+    
+    if engine not in ENGINES:
+        raise ValueError(f"Unsupported engine: {engine}")
+    
     filepath = Path(filepath)
     file_extension = filepath.suffix.lower()
     
     try:
-        if file_extension == '.csv':
+        if file_extension == '.csv' and engine != 'pandas':
+            return _read_csv_with_engine(filepath, engine, **kwargs)
+        elif file_extension == '.csv':
             return pd.read_csv(filepath, **kwargs)
         elif file_extension in ['.xlsx', '.xls']:
             return pd.read_excel(filepath, **kwargs)
         elif file_extension == '.json':
             return pd.read_json(filepath, **kwargs)
+        elif file_extension == '.parquet' and engine != 'pandas':
+            return _read_parquet_with_engine(filepath, engine)
         elif file_extension == '.parquet':
             return pd.read_parquet(filepath, **kwargs)
         elif file_extension in ['.tsv', '.tab']:
@@ -46,6 +128,71 @@ def load_dataframe_from_file(filepath, **kwargs):
         raise Exception(f"Error loading file '{filepath}': {str(e)}")
 
 
+def _iter_parquet_batches(filepath, chunksize):
+    """
+    Yield a Parquet file as DataFrames of at most chunksize rows.
+    
+    Args:
+        filepath: Path to the Parquet file
+        chunksize: Number of rows per chunk
+        
+    Yields:
+        pandas.DataFrame: Next chunk, indexed continuously across chunks
+    """
+    import pandas as pd
+    import pyarrow.parquet as pq
+    
+    start = 0
+    for batch in pq.ParquetFile(filepath).iter_batches(batch_size=chunksize):
+        chunk = batch.to_pandas()
+        if isinstance(chunk.index, pd.RangeIndex):
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+
+def load_dataframe_chunks(filepath, chunksize, **kwargs):
+    """
+    Load a CSV, TSV or Parquet file lazily in chunks.
+    
+    Only the first chunk is read up front; the remaining chunks are read
+    as they are requested.
+    
+    Args:
+        filepath: Path to the data file
+        chunksize: Number of rows per chunk
+        **kwargs: Additional arguments for pandas.read_csv (ignored for Parquet)
+        
+    Returns:
+        tuple: (first chunk as pandas.DataFrame, iterator over the remaining chunks)
+        
+    Raises:
+        ValueError: If file format does not support chunked reading
+        Exception: If file cannot be read
+    """
+    import pandas as pd
+    
+    filepath = Path(filepath)
+    file_extension = filepath.suffix.lower()
+    
+    try:
+        if file_extension == '.csv':
+            chunks = iter(pd.read_csv(filepath, chunksize=chunksize, **kwargs))
+        elif file_extension in ['.tsv', '.tab']:
+            chunks = iter(pd.read_csv(filepath, sep='\t', chunksize=chunksize, **kwargs))
+        elif file_extension == '.parquet':
+            chunks = _iter_parquet_batches(filepath, chunksize)
+        else:
+            raise ValueError(f"Chunked reading is not supported for: {file_extension}")
+        
+        first = next(chunks, None)
+        if first is None:
+            first = pd.DataFrame()
+        return first, chunks
+    except Exception as e:
+        raise Exception(f"Error loading file '{filepath}': {str(e)}")
+
+
 def create_sample_dataframe():
     """
     Create a sample DataFrame for demonstration purposes.
@@ -54,7 +201,7 @@ def create_sample_dataframe():
         pandas.DataFrame: Sample DataFrame with various data types
     """
     import numpy as np
-    from datetime import datetime, timedelta
+    import pandas as pd
     
     # Create sample data with various types
     np.random.seed(42)
@@ -62,11 +209,11 @@ def create_sample_dataframe():
     
     return pd.DataFrame({
         'ID': range(1, n_rows + 1),
-        'Name': [f'Person_{i}' for i in range(1, n_rows + 1)],
+        'Name': 'Person_' + pd.Index(np.arange(1, n_rows + 1)).astype(str),
         'Age': np.random.randint(18, 80, n_rows),
         'Salary': np.random.normal(50000, 15000, n_rows).round(2),
         'Department': np.random.choice(['Engineering', 'Marketing', 'Sales', 'HR', 'Finance'], n_rows),
-        'Join_Date': [datetime.now() - timedelta(days=np.random.randint(0, 3650)) for _ in range(n_rows)],
+        'Join_Date': pd.Timestamp.now() - pd.to_timedelta(np.random.randint(0, 3650, n_rows), unit='D'),
         'Performance_Score': np.random.uniform(1.0, 5.0, n_rows).round(2),
         'Is_Active': np.random.choice([True, False], n_rows, p=[0.8, 0.2])
     })
@@ -114,6 +261,29 @@ def main():
         help="Table display mode (default: advanced)"
     )
     
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="pandas",
+        help="Reader for CSV and Parquet files; pyarrow and polars decode "
+             "in parallel (default: pandas)"
+    )
+    
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Read CSV, TSV and Parquet files in chunks and show only the "
+             "first chunk; further chunks are read only when requested "
+             "through the /rows route (ignores --engine)"
+    )
+    
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=10000,
+        help="Rows per chunk with --low-memory (default: 10000)"
+    )
+    
     parser.add_argument(
         "--sample", 
         action="store_true",
@@ -148,6 +318,7 @@ def main():
     args = parser.parse_args()
 
     # Load DataFrame
+    chunks = None
     try:
         if args.sample:
             df = create_sample_dataframe()
@@ -164,8 +335,13 @@ def main():
             elif args.data_file.endswith(('.xlsx', '.xls')) and args.sheet:
                 load_kwargs['sheet_name'] = args.sheet
             
-            df = load_dataframe_from_file(args.data_file, **load_kwargs)
-            print(f"Loaded DataFrame from '{args.data_file}' with shape: {df.shape}")
+            if args.low_memory:
+                df, chunks = load_dataframe_chunks(args.data_file, args.chunksize, **load_kwargs)
+                print(f"Loaded first {len(df)} rows from '{args.data_file}'; "
+                      f"remaining rows are read only through the /rows route")
+            else:
+                df = load_dataframe_from_file(args.data_file, engine=args.engine, **load_kwargs)
+                print(f"Loaded DataFrame from '{args.data_file}' with shape: {df.shape}")
         else:
             print("Error: No data file specified and --sample not used.", file=sys.stderr)
             print("Use --help for usage information.", file=sys.stderr)
@@ -179,14 +355,22 @@ def main():
     if df.empty:
         print("Warning: DataFrame is empty", file=sys.stderr)
     
+    # Import the UI stack only once there is something to show
+    from cacao import App
+    from cacao_pandas_ui.viewer import PandasTablePage
+    
     # Create app and set up the page
     app = App()
-    viewer = PandasTablePage(df, title=args.title, mode=args.mode)
+    viewer = PandasTablePage(df, title=args.title, mode=args.mode, chunks=chunks)
     
     @app.mix("/")
     def home():
         return viewer.render()
 
+    @app.mix("/rows")
+    def rows(offset=0, limit=None):
+        return viewer.get_rows(offset=int(offset), limit=int(limit) if limit else None)
+
     # Brew as desktop window
     app.brew(
         type="desktop",
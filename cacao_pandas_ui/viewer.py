@@ -1,9 +1,13 @@
 """
 Pandas DataFrame Table Viewer for Cacao
 """
+import sys
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 
 try:
     from cacao.ui.components.data import Table, create_simple_table, create_advanced_table
@@ -12,13 +16,338 @@ try:
 except ImportError:
     CACAO_COMPONENTS_AVAILABLE = False
 
+# Arrow-backed columns (e.g. from the pyarrow/polars loaders); pandas < 1.5
+# has no ArrowDtype, and isinstance() against an empty tuple is always False
+_ARROW_DTYPE = getattr(pd, "ArrowDtype", ())
+
+# Below this many rows, thread startup costs more than converting columns
+# one after another
+_PARALLEL_MIN_ROWS = 10_000
+_MAX_WORKERS = 8
+
+# Static component styles, shared by every render. Treat them as read-only;
+# Cacao serializes them as plain dicts.
+_PAGE_STYLE = {
+    "height": "100%",
+    "display": "flex",
+    "flexDirection": "column",
+    "backgroundColor": "#FFFFFF",
+    "fontFamily": "Arial, sans-serif"
+}
+
+_TABLE_CONTAINER_STYLE = {
+    "flex": "1",
+    "overflow": "auto",
+    "border": "1px solid #E2E8F0"
+}
+
+_TOOLBAR_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "padding": "8px 12px",
+    "backgroundColor": "#F8F9FA",
+    "borderBottom": "1px solid #E2E8F0",
+    "gap": "8px",
+    "fontFamily": "Arial, sans-serif",
+    "fontSize": "13px"
+}
+
+_TOOLBAR_BUTTON_STYLE = {
+    "padding": "6px 12px",
+    "color": "white",
+    "border": "none",
+    "borderRadius": "4px",
+    "cursor": "pointer",
+    "fontSize": "13px",
+    "fontWeight": "500"
+}
+
+_TOOLBAR_BUTTON_CSV_STYLE = {**_TOOLBAR_BUTTON_STYLE, "backgroundColor": "#4CAF50"}
+
+_TOOLBAR_BUTTON_EXCEL_STYLE = {**_TOOLBAR_BUTTON_STYLE, "backgroundColor": "#2196F3"}
+
+_TOOLBAR_SHAPE_STYLE = {
+    "marginLeft": "auto",
+    "color": "#666",
+    "fontSize": "12px"
+}
+
+_TABLE_STYLE = {
+    "width": "100%",
+    "border": "1px solid #D4D4D4",
+    "borderCollapse": "collapse",
+    "fontSize": "13px",
+    "fontFamily": "Arial, sans-serif",
+    "backgroundColor": "#FFFFFF"
+}
+
+_HEADER_STYLE = {
+    "backgroundColor": "#F2F2F2",
+    "fontWeight": "bold",
+    "padding": "6px 8px",
+    "textAlign": "left",
+    "border": "1px solid #D4D4D4",
+    "color": "#333333"
+}
+
+_ADVANCED_HEADER_STYLE = {
+    **_HEADER_STYLE,
+    "position": "sticky",
+    "top": "0",
+    "zIndex": "1"
+}
+
+_CELL_STYLE = {
+    "padding": "6px 8px",
+    "border": "1px solid #D4D4D4",
+    "textAlign": "left",
+    "verticalAlign": "top"
+}
+
+_ROW_STYLE = {
+    "hover": {
+        "backgroundColor": "#E8F4FD"
+    }
+}
+
+_ADVANCED_ROW_STYLE = {
+    **_ROW_STYLE,
+    "alternating": {
+        "backgroundColor": "#FAFAFA"
+    }
+}
+
+
+def _fill_na(values, na):
+    """
+    Convert an object array to a list with "N/A" for missing values.
+    
+    Args:
+        values: Object ndarray of converted values, modified in place
+        na: Boolean ndarray marking the missing positions, computed once per column
+        
+    Returns:
+        list: Converted values
+    """
+    if na.any():
+        values[na] = "N/A"
+    return values.tolist()
+
+
+def _conv_datetime(series):
+    """Format a datetime column, with "N/A" for missing values."""
+    if isinstance(series.dtype, _ARROW_DTYPE):
+        # Arrow's strftime prints fractional seconds, so format the
+        # equivalent numpy-backed column instead
+        dtype = series.dtype.numpy_dtype
+        tz = getattr(series.dtype.pyarrow_dtype, "tz", None)
+        if tz is not None:
+            dtype = pd.DatetimeTZDtype(np.datetime_data(dtype)[0], tz)
+        series = series.astype(dtype)
+    na = series.isna().to_numpy()
+    formatted = series.dt.strftime("%Y-%m-%d %H:%M:%S")
+    return _fill_na(formatted.to_numpy(dtype=object), na)
+
+
+def _conv_numeric(series):
+    """Convert a numeric column to Python numbers, with "N/A" for missing values."""
+    na = series.isna().to_numpy()
+    if not na.any() and isinstance(series.dtype, np.dtype):
+        return series.tolist()
+    # Go through object values, as nullable and Arrow-backed numeric arrays
+    # reject the "N/A" string and would otherwise come back as floats, and
+    # extension arrays may hand out numpy scalars from tolist()
+    return _fill_na(series.to_numpy(dtype=object), na)
+
+
+def _round_significant(values, digits):
+    """
+    Round floats to significant digits, as float("%.*g" % (digits, x)) does.
+    
+    Args:
+        values: Float ndarray to round
+        digits: Number of significant digits to keep
+    
+    Returns:
+        numpy.ndarray: Rounded values; zero, NaN and infinity are kept as they are
+    """
+    finite = np.isfinite(values) & (values != 0)
+    magnitude = np.floor(np.log10(np.abs(values, where=finite, out=np.ones_like(values))))
+    decimals = digits - 1 - magnitude
+    # Powers of ten up to 1e15 keep the scaled values exact enough to round
+    # like the formatted string; the rare values beyond are formatted one by one
+    scaled = finite & (np.abs(decimals) <= 15)
+    scale = 10.0 ** np.abs(np.where(scaled, decimals, 0))
+    up = np.where(decimals > 0, scale, 1.0)
+    down = np.where(decimals > 0, 1.0, scale)
+    rounded = np.where(scaled, np.round(values * up / down) * down / up, values)
+    for i in np.flatnonzero(finite & ~scaled):
+        rounded[i] = float("%.*g" % (digits, values[i]))
+    return rounded
+
+
+def _conv_float(series, digits):
+    """Round a float column to significant digits, with "N/A" for missing values."""
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    na = np.isnan(values)
+    values = _round_significant(values, digits)
+    if not na.any():
+        return values.tolist()
+    return _fill_na(values.astype(object), na)
+
+
+def _conv_bool(series):
+    """Convert a boolean column to Python bools, with "N/A" for missing values."""
+    if series.dtype == bool:
+        return series.tolist()  # numpy bools cannot be missing
+    return _conv_numeric(series)
+
+
+def _conv_sparse(series, float_precision=None):
+    """Densify a sparse column and convert it by its value dtype."""
+    dense = series.sparse.to_dense()
+    return _pick_converter(dense.dtype, float_precision)(dense)
+
+
+def _conv_category(series):
+    """Convert a categorical column by stringifying its categories once."""
+    # Gather from the stringified categories; code -1 (missing) picks the
+    # trailing "N/A"
+    labels = np.append(series.cat.categories.astype(str).to_numpy(dtype=object), "N/A")
+    return labels[series.cat.codes.to_numpy()].tolist()
+
+
+def _conv_str(series):
+    """Convert any other column to strings, with "N/A" for missing values."""
+    inferred = None
+    if series.dtype == object:
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred == "datetime":
+        # Parse object columns of datetime values so they can be formatted
+        # in one pass as well; mixed time zones stay strings
+        try:
+            return _conv_datetime(pd.to_datetime(series))
+        except (ValueError, TypeError):
+            pass
+    na = series.isna().to_numpy()
+    is_text = inferred == "string" or (
+        isinstance(series.dtype, (pd.StringDtype, _ARROW_DTYPE))
+        and pd.api.types.is_string_dtype(series.dtype))
+    if is_text:
+        # Already strings, so skip the astype(str) copy; Arrow-backed
+        # columns convert straight from Arrow without a numpy detour
+        if not na.any():
+            if (isinstance(series.dtype, _ARROW_DTYPE)
+                    or getattr(series.dtype, "storage", None) == "pyarrow"):
+                return series.array.__arrow_array__().to_pylist()
+            return series.tolist()
+        return _fill_na(series.to_numpy(dtype=object, copy=True), na)
+    return _fill_na(series.astype(str).to_numpy(dtype=object), na)
+
+
+def _pick_converter(dtype, float_precision=None):
+    """
+    Choose the column converter for a dtype.
+    
+    Args:
+        dtype: dtype of the column to convert
+        float_precision: Significant digits to round float columns to, or
+            None to keep full precision
+        
+    Returns:
+        callable: Function converting a whole Series to a list of JSON-friendly values
+    """
+    if isinstance(dtype, pd.SparseDtype):
+        return partial(_conv_sparse, float_precision=float_precision)
+    if isinstance(dtype, _ARROW_DTYPE):
+        import pyarrow as pa
+        arrow_type = dtype.pyarrow_dtype
+        if pa.types.is_decimal(arrow_type) or pa.types.is_date(arrow_type):
+            # Decimal objects have no JSON representation, and dates carry no
+            # time of day; the pandas engine shows both as plain strings
+            # ("1.50", "2022-03-15")
+            return _conv_str
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return _conv_datetime
+    if pd.api.types.is_complex_dtype(dtype):
+        return _conv_str  # complex numbers have no JSON representation
+    if pd.api.types.is_bool_dtype(dtype):
+        return _conv_bool
+    if float_precision is not None and pd.api.types.is_float_dtype(dtype):
+        return partial(_conv_float, digits=float_precision)
+    if pd.api.types.is_numeric_dtype(dtype):
+        return _conv_numeric
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _conv_category
+    return _conv_str
+
+
+def _unique_keys(names):
+    """
+    Build unique, interned column keys from column names.
+    
+    Names that repeat, or only collide once stringified (such as 1 and "1"),
+    get a ".N" suffix as pandas does for duplicate CSV headers. "_index" is
+    reserved for the row index.
+    
+    Args:
+        names: Column names of the DataFrame
+        
+    Returns:
+        list: One unique key per column, in column order
+    """
+    seen = {"_index"}
+    keys = []
+    for name in names:
+        key = base = str(name)
+        suffix = 0
+        while key in seen:
+            suffix += 1
+            key = f"{base}.{suffix}"
+        seen.add(key)
+        keys.append(sys.intern(key))
+    return keys
+
+
+def _build_records(table_data):
+    """
+    Assemble row dictionaries from column-major table data.
+    
+    Args:
+        table_data: Table data as returned by PandasTablePage._prepare_table_data
+        
+    Returns:
+        list: One dict per row, keyed by column plus "_index"
+    """
+    keys = ["_index"] + [col["key"] for col in table_data["columns"]]
+    values = [table_data["index"]] + [table_data["columnData"][col["key"]]
+                                      for col in table_data["columns"]]
+    return [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def _assemble_rows(columns):
+    """
+    Assemble row lists from converted column lists.
+    
+    The columns hold mixed Python objects (numbers, strings, "N/A"), which a
+    JIT cannot compile; zip already transposes them at C speed.
+    
+    Args:
+        columns: List of equally long lists, one per column
+        
+    Returns:
+        list: One list of cell values per row
+    """
+    return list(map(list, zip(*columns)))
+
 
 class PandasTablePage:
     """
     A page class that renders pandas DataFrames as interactive tables.
     """
     
-    def __init__(self, dataframe, title=None, mode="advanced"):
+    def __init__(self, dataframe, title=None, mode="advanced", page_size=1000, chunks=None,
+                 float_precision=6, source_rows=None):
         """
         Initialize the PandasTablePage.
         
@@ -26,6 +355,17 @@ class PandasTablePage:
             dataframe: pandas DataFrame to display
             title: Title for the table display (optional, but will be ignored for display)
             mode: "simple" or "advanced" table mode
+            page_size: Number of rows in the initial table window; other
+                windows are served by get_rows()
+            chunks: Optional iterator of further DataFrames continuing
+                dataframe (e.g. from a chunked reader); chunks are read only
+                when get_rows() reaches past the rows loaded so far, and are
+                kept alongside dataframe rather than concatenated into it
+            float_precision: Significant digits float values are rounded to
+                before being sent to the table, or None for full precision
+                (default: 6)
+            source_rows: Row count of the full data when dataframe is only its
+                first rows; the toolbar then shows "Rows: N of M" (optional)
         """
         if not isinstance(dataframe, pd.DataFrame):
             raise ValueError("Input must be a pandas DataFrame")
@@ -33,59 +373,228 @@ class PandasTablePage:
         self.dataframe = dataframe
         self.title = title
         self.mode = mode
+        self.page_size = page_size
+        self.float_precision = float_precision
+        self.source_rows = source_rows
+        self._chunk_iter = iter(chunks) if chunks is not None else None
+        
+        # Loaded chunks (dataframe first) and the cumulative row count at the
+        # end of each, so windows can be sliced without concatenating them all
+        self._chunks = [dataframe]
+        self._chunk_ends = [len(dataframe)]
+        
+        # Cached render output; the DataFrame is not expected to change.
+        # The plugin's rendered table is kept apart from the page tree so
+        # loading further chunks, which only changes the toolbar, never
+        # converts the DataFrame again.
+        self._rendered = None
+        self._table_data = None
+        self._table_component_rendered = None
+        self._shape_text = self._describe_shape()
+        self._toolbar = self._build_toolbar(self._shape_text)
         
         # Initialize PandasTablePlugin
         if CACAO_COMPONENTS_AVAILABLE:
             self.plugin = PandasTablePlugin(
                 enhanced_mode=(mode == "advanced"),
-                row_threshold=100,
+                row_threshold=page_size,
                 memory_threshold_mb=1
             )
 
-    def _prepare_table_data(self):
+    def invalidate(self):
+        """
+        Discard cached render output.
+        
+        Call this after mutating the DataFrame so the next render() rebuilds
+        the table from the current data.
+        """
+        self._rendered = None
+        self._table_data = None
+        self._table_component_rendered = None
+        self._chunks[0] = self.dataframe
+        self._chunk_ends = np.cumsum([len(chunk) for chunk in self._chunks]).tolist()
+        self._shape_text = self._describe_shape()
+        self._toolbar = self._build_toolbar(self._shape_text)
+
+    def _refresh_row_count(self):
+        """
+        Update cached render output after more chunks were loaded.
+        
+        The rows already rendered are unchanged, so only the toolbar and the
+        row counts are rebuilt; the cached table is kept.
+        """
+        n_rows = self._chunk_ends[-1]
+        self._shape_text = self._describe_shape()
+        self._toolbar = self._build_toolbar(self._shape_text)
+        
+        if self._table_data is not None:
+            self._table_data.update(totalRows=n_rows, hasMore=self._chunk_iter is not None,
+                                    shape=(n_rows, self.dataframe.shape[1]))
+        if self._rendered is not None:
+            children = self._rendered["props"]["children"]
+            children[0] = self._toolbar
+            table = children[1]["props"]["children"][0]
+            if "totalRows" in table.get("props", {}):
+                table["props"]["totalRows"] = n_rows
+
+    def _describe_shape(self):
+        """
+        Summarize the DataFrame shape for the toolbar.
+        
+        Returns:
+            str: Row and column counts, noting truncation against source_rows
+                and marking unread chunks with "+"
+        """
+        n_rows, n_cols = self._chunk_ends[-1], self.dataframe.shape[1]
+        if self.source_rows is not None and self.source_rows > n_rows:
+            return f"Rows: {n_rows} of {self.source_rows} | Columns: {n_cols}"
+        more = "+" if self._chunk_iter is not None else ""
+        return f"Rows: {n_rows}{more} | Columns: {n_cols}"
+
+    def _load_rows(self, n_rows):
+        """
+        Read chunks from the chunk iterator until n_rows rows are loaded.
+        
+        Args:
+            n_rows: Number of rows that should be available
+        """
+        if self._chunk_iter is None or self._chunk_ends[-1] >= n_rows:
+            return
+        
+        for chunk in self._chunk_iter:
+            self._chunks.append(chunk)
+            self._chunk_ends.append(self._chunk_ends[-1] + len(chunk))
+            if self._chunk_ends[-1] >= n_rows:
+                break
+        else:
+            self._chunk_iter = None
+        
+        self._refresh_row_count()
+
+    def _slice_rows(self, offset, limit):
+        """
+        Get rows offset to offset + limit across the loaded chunks.
+        
+        Only the chunks overlapping the window are touched, and they are
+        concatenated only when the window spans more than one.
+        
+        Args:
+            offset: Position of the first row
+            limit: Maximum number of rows
+            
+        Returns:
+            pandas.DataFrame: The requested rows
+        """
+        stop = min(offset + limit, self._chunk_ends[-1])
+        first = bisect_right(self._chunk_ends, offset)
+        pieces = []
+        for i in range(first, len(self._chunks)):
+            start = self._chunk_ends[i - 1] if i else 0
+            if start >= stop:
+                break
+            pieces.append(self._chunks[i].iloc[max(offset - start, 0):stop - start])
+        
+        if not pieces:
+            return self.dataframe.iloc[0:0]
+        if len(pieces) == 1:
+            return pieces[0]
+        return pd.concat(pieces)
+
+    def get_rows(self, offset=0, limit=None):
+        """
+        Get a window of rows, e.g. for a client that loads rows lazily.
+        
+        Args:
+            offset: Position of the first row to return (default: 0)
+            limit: Maximum number of rows to return (default: page_size)
+            
+        Returns:
+            dict: Table data structure for the requested rows
+            
+        Raises:
+            ValueError: If offset or limit is negative
+        """
+        if offset < 0:
+            raise ValueError(f"offset must not be negative, got {offset}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must not be negative, got {limit}")
+        return self._prepare_table_data(offset=offset, limit=limit)
+
+    def _prepare_table_data(self, offset=0, limit=None):
         """
-        Prepare DataFrame data for table display.
+        Prepare a window of DataFrame rows for table display.
+        
+        Args:
+            offset: Position of the first row to include (default: 0)
+            limit: Maximum number of rows to include (default: page_size)
         
         Returns:
             dict: Table data structure compatible with cacao table components
         """
-        # Convert DataFrame to table-compatible format
-        df = self.dataframe.copy()
-        
-        # Handle missing values
-        df = df.fillna("N/A")
-        
-        # Convert to records format for table
-        columns = [{"key": col, "title": col, "dataType": str(df[col].dtype)} 
-                  for col in df.columns]
-        
-        # Convert DataFrame to list of dictionaries
-        data = []
-        for idx, row in df.iterrows():
-            row_data = {"_index": str(idx)}
-            for col in df.columns:
-                value = row[col]
-                # Handle different data types
-                if pd.isna(value):
-                    row_data[col] = "N/A"
-                elif isinstance(value, (int, float)):
-                    row_data[col] = value
-                elif isinstance(value, (datetime, pd.Timestamp)):
-                    row_data[col] = value.strftime("%Y-%m-%d %H:%M:%S")
-                else:
-                    row_data[col] = str(value)
-            data.append(row_data)
+        if limit is None:
+            limit = self.page_size
+        self._load_rows(offset + limit)
         
-        return {
+        # Only the initial window is rendered on every request, so cache it
+        is_initial = offset == 0 and limit == self.page_size
+        if is_initial and self._table_data is not None:
+            return self._table_data
+        
+        # Rendering is read-only, so slice the DataFrame without copying
+        df = self._slice_rows(offset, limit)
+        
+        # Unique, interned column keys: the row dicts built from them
+        # downstream share key objects, and repeated names keep their data
+        keys = _unique_keys(df.columns)
+        
+        # Column descriptors for the table header
+        columns = [{"key": key, "title": str(col), "dataType": str(dtype)} 
+                  for key, col, dtype in zip(keys, df.columns, df.dtypes)]
+        
+        # Pick one converter per column from its dtype, then convert whole columns
+        converters = [_pick_converter(dtype, self.float_precision) for dtype in df.dtypes]
+        series_list = [df.iloc[:, i] for i in range(df.shape[1])]
+        if len(df) >= _PARALLEL_MIN_ROWS and len(series_list) > 1:
+            # Most of the work runs in pandas/numpy C routines that release
+            # the GIL, so columns convert concurrently
+            with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(series_list))) as executor:
+                converted = list(executor.map(lambda convert, series: convert(series),
+                                              converters, series_list))
+        else:
+            converted = [convert(series) for convert, series in zip(converters, series_list)]
+        cols_out = dict(zip(keys, converted))
+        
+        # Keep the payload column-major; rows are assembled only where a
+        # table component needs them
+        table_data = {
             "columns": columns,
-            "data": data,
-            "totalRows": len(df),
-            "shape": df.shape
+            "columnData": cols_out,
+            "index": df.index.map(str).tolist(),
+            "offset": offset,
+            "totalRows": self._chunk_ends[-1],
+            "hasMore": self._chunk_iter is not None,
+            "shape": (self._chunk_ends[-1], self.dataframe.shape[1])
         }
+        if is_initial:
+            self._table_data = table_data
+        return table_data
 
     def _create_toolbar(self):
         """
-        Create Excel-like toolbar with action buttons.
+        Get the Excel-like toolbar, built once per DataFrame shape.
+        
+        Returns:
+            dict: Toolbar component structure
+        """
+        return self._toolbar
+
+    @staticmethod
+    def _build_toolbar(shape_text):
+        """
+        Build Excel-like toolbar with action buttons.
+        
+        Args:
+            shape_text: Row and column count summary shown on the right
         
         Returns:
             dict: Toolbar component structure
@@ -93,58 +602,27 @@ class PandasTablePage:
         return {
             "type": "div",
             "props": {
-                "style": {
-                    "display": "flex",
-                    "alignItems": "center",
-                    "padding": "8px 12px",
-                    "backgroundColor": "#F8F9FA",
-                    "borderBottom": "1px solid #E2E8F0",
-                    "gap": "8px",
-                    "fontFamily": "Arial, sans-serif",
-                    "fontSize": "13px"
-                },
+                "style": _TOOLBAR_STYLE,
                 "children": [
                     {
                         "type": "button",
                         "props": {
                             "label": "Download CSV",
-                            "style": {
-                                "padding": "6px 12px",
-                                "backgroundColor": "#4CAF50",
-                                "color": "white",
-                                "border": "none",
-                                "borderRadius": "4px",
-                                "cursor": "pointer",
-                                "fontSize": "13px",
-                                "fontWeight": "500"
-                            }
+                            "style": _TOOLBAR_BUTTON_CSV_STYLE
                         }
                     },
                     {
                         "type": "button",
                         "props": {
                             "label": "Download Excel",
-                            "style": {
-                                "padding": "6px 12px",
-                                "backgroundColor": "#2196F3",
-                                "color": "white",
-                                "border": "none",
-                                "borderRadius": "4px",
-                                "cursor": "pointer",
-                                "fontSize": "13px",
-                                "fontWeight": "500"
-                            }
+                            "style": _TOOLBAR_BUTTON_EXCEL_STYLE
                         }
                     },
                     {
                         "type": "div",
                         "props": {
-                            "style": {
-                                "marginLeft": "auto",
-                                "color": "#666",
-                                "fontSize": "12px"
-                            },
-                            "content": f"Rows: {self.dataframe.shape[0]} | Columns: {self.dataframe.shape[1]}"
+                            "style": _TOOLBAR_SHAPE_STYLE,
+                            "content": shape_text
                         }
                     }
                 ]
@@ -158,32 +636,26 @@ class PandasTablePage:
         Returns:
             dict: Cacao component structure for rendering
         """
+        if self._rendered is not None:
+            return self._rendered
+        
         # Use PandasTablePlugin if available, otherwise fallback to basic implementation
         if CACAO_COMPONENTS_AVAILABLE:
-            table_component = self.plugin.process(self.dataframe)
+            if self._table_component_rendered is None:
+                self._table_component_rendered = self.plugin.process(self.dataframe).render()
             
             # Create Excel-like layout with toolbar and no title
-            return {
+            result = {
                 "type": "div",
                 "props": {
-                    "style": {
-                        "height": "100%",
-                        "display": "flex",
-                        "flexDirection": "column",
-                        "backgroundColor": "#FFFFFF",
-                        "fontFamily": "Arial, sans-serif"
-                    },
+                    "style": _PAGE_STYLE,
                     "children": [
                         self._create_toolbar(),
                         {
                             "type": "div",
                             "props": {
-                                "style": {
-                                    "flex": "1",
-                                    "overflow": "auto",
-                                    "border": "1px solid #E2E8F0"
-                                },
-                                "children": [table_component.render()]
+                                "style": _TABLE_CONTAINER_STYLE,
+                                "children": [self._table_component_rendered]
                             }
                         }
                     ]
@@ -194,26 +666,16 @@ class PandasTablePage:
             table_data = self._prepare_table_data()
             
             # Create Excel-like layout with toolbar and no title
-            return {
+            result = {
                 "type": "div",
                 "props": {
-                    "style": {
-                        "height": "100%",
-                        "display": "flex",
-                        "flexDirection": "column",
-                        "backgroundColor": "#FFFFFF",
-                        "fontFamily": "Arial, sans-serif"
-                    },
+                    "style": _PAGE_STYLE,
                     "children": [
                         self._create_toolbar(),
                         {
                             "type": "div",
                             "props": {
-                                "style": {
-                                    "flex": "1",
-                                    "overflow": "auto",
-                                    "border": "1px solid #E2E8F0"
-                                },
+                                "style": _TABLE_CONTAINER_STYLE,
                                 "children": [self._create_table_component(table_data)]
                             }
                         }
@@ -221,6 +683,9 @@ class PandasTablePage:
                 }
             }
 
+        self._rendered = result
+        return result
+
     def _create_table_component(self, table_data):
         """
         Create the appropriate table component based on mode.
@@ -251,34 +716,12 @@ class PandasTablePage:
             "props": {
                 "id": "pandasTable",
                 "columns": table_data["columns"],
-                "data": table_data["data"],
-                "style": {
-                    "width": "100%",
-                    "border": "1px solid #D4D4D4",
-                    "borderCollapse": "collapse",
-                    "fontSize": "13px",
-                    "fontFamily": "Arial, sans-serif",
-                    "backgroundColor": "#FFFFFF"
-                },
-                "headerStyle": {
-                    "backgroundColor": "#F2F2F2",
-                    "fontWeight": "bold",
-                    "padding": "6px 8px",
-                    "textAlign": "left",
-                    "border": "1px solid #D4D4D4",
-                    "color": "#333333"
-                },
-                "cellStyle": {
-                    "padding": "6px 8px",
-                    "border": "1px solid #D4D4D4",
-                    "textAlign": "left",
-                    "verticalAlign": "top"
-                },
-                "rowStyle": {
-                    "hover": {
-                        "backgroundColor": "#E8F4FD"
-                    }
-                }
+                "data": _build_records(table_data),
+                "totalRows": table_data["totalRows"],
+                "style": _TABLE_STYLE,
+                "headerStyle": _HEADER_STYLE,
+                "cellStyle": _CELL_STYLE,
+                "rowStyle": _ROW_STYLE
             }
         }
 
@@ -297,11 +740,9 @@ class PandasTablePage:
             # Create table headers from DataFrame columns
             headers = [col["title"] for col in table_data["columns"]]
             
-            # Create table rows from DataFrame data
-            rows = []
-            for row_data in table_data["data"]:
-                row = [row_data.get(col["key"], "") for col in table_data["columns"]]
-                rows.append(row)
+            # Create table rows from the converted columns
+            column_data = table_data["columnData"]
+            rows = _assemble_rows([column_data[col["key"]] for col in table_data["columns"]])
             
             # Create Table component with advanced features
             table = Table(headers=headers, rows=rows, advanced=True)
@@ -313,45 +754,18 @@ class PandasTablePage:
                 "props": {
                     "id": "pandasAdvancedTable",
                     "columns": table_data["columns"],
-                    "data": table_data["data"],
-                    "style": {
-                        "width": "100%",
-                        "border": "1px solid #D4D4D4",
-                        "borderCollapse": "collapse",
-                        "fontSize": "13px",
-                        "fontFamily": "Arial, sans-serif",
-                        "backgroundColor": "#FFFFFF"
-                    },
-                    "headerStyle": {
-                        "backgroundColor": "#F2F2F2",
-                        "color": "#333333",
-                        "fontWeight": "bold",
-                        "padding": "6px 8px",
-                        "textAlign": "left",
-                        "border": "1px solid #D4D4D4",
-                        "position": "sticky",
-                        "top": "0",
-                        "zIndex": "1"
-                    },
-                    "cellStyle": {
-                        "padding": "6px 8px",
-                        "border": "1px solid #D4D4D4",
-                        "textAlign": "left",
-                        "verticalAlign": "top"
-                    },
-                    "rowStyle": {
-                        "hover": {
-                            "backgroundColor": "#E8F4FD"
-                        },
-                        "alternating": {
-                            "backgroundColor": "#FAFAFA"
-                        }
-                    }
+                    "data": _build_records(table_data),
+                    "totalRows": table_data["totalRows"],
+                    "style": _TABLE_STYLE,
+                    "headerStyle": _ADVANCED_HEADER_STYLE,
+                    "cellStyle": _CELL_STYLE,
+                    "rowStyle": _ADVANCED_ROW_STYLE
                 }
             }
 
 
-def preview_dataframe(dataframe, title=None, width=1000, height=700, mode="advanced"):
+def preview_dataframe(dataframe, title=None, width=1000, height=700, mode="advanced",
+                      max_rows=100_000):
     """
     Preview pandas DataFrame in a desktop window.
 
@@ -361,6 +775,8 @@ def preview_dataframe(dataframe, title=None, width=1000, height=700, mode="advan
         width: Window width (default: 1000)
         height: Window height (default: 700)
         mode: Table mode - "simple" or "advanced" (default: "advanced")
+        max_rows: Show only the first max_rows rows of larger DataFrames, or
+            None to show all rows (default: 100000)
     
     Example:
         import pandas as pd
@@ -379,8 +795,6 @@ def preview_dataframe(dataframe, title=None, width=1000, height=700, mode="advan
         # Preview without title
         preview_dataframe(df, mode="simple")
     """
-    import sys
-    
     # Prevent infinite loops in framework reload scenarios
     if hasattr(sys, '_cacao_pandas_viewer_running'):
         print("Warning: Cacao Pandas UI is already running. Ignoring duplicate call.")
@@ -391,13 +805,24 @@ def preview_dataframe(dataframe, title=None, width=1000, height=700, mode="advan
     try:
         from cacao import App
 
+        source_rows = None
+        if max_rows is not None and len(dataframe) > max_rows:
+            print(f"Warning: DataFrame has {len(dataframe)} rows; "
+                  f"showing the first {max_rows}. Pass max_rows=None to show all rows.")
+            source_rows = len(dataframe)
+            dataframe = dataframe.head(max_rows)
+
         app = App()
-        viewer = PandasTablePage(dataframe, title=title, mode=mode)
+        viewer = PandasTablePage(dataframe, title=title, mode=mode, source_rows=source_rows)
 
         @app.mix("/")
         def home():
             return viewer.render()
 
+        @app.mix("/rows")
+        def rows(offset=0, limit=None):
+            return viewer.get_rows(offset=int(offset), limit=int(limit) if limit else None)
+
         # Set window title - use provided title or default
         window_title = title if title else "Pandas DataFrame Viewer"
         
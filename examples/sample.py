@@ -3,7 +3,6 @@ Sample usage of cacao_pandas_ui with pandas DataFrames.
 """
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 from cacao_pandas_ui import preview_dataframe, PandasTablePage, create_advanced_table
 
 
@@ -17,11 +16,11 @@ def create_sample_dataframe():
     # Create sample data with various types
     data = {
         'ID': range(1, n_rows + 1),
-        'Name': [f'Employee_{i}' for i in range(1, n_rows + 1)],
+        'Name': 'Employee_' + pd.Index(np.arange(1, n_rows + 1)).astype(str),
         'Age': np.random.randint(22, 65, n_rows),
         'Salary': np.random.normal(75000, 25000, n_rows).round(2),
         'Department': np.random.choice(['Engineering', 'Marketing', 'Sales', 'HR', 'Finance'], n_rows),
-        'Join_Date': [datetime.now() - timedelta(days=np.random.randint(30, 2000)) for _ in range(n_rows)],
+        'Join_Date': pd.Timestamp.now() - pd.to_timedelta(np.random.randint(30, 2000, n_rows), unit='D'),
         'Performance_Score': np.random.uniform(2.5, 5.0, n_rows).round(2),
         'Is_Active': np.random.choice([True, False], n_rows, p=[0.85, 0.15]),
         'Bonus_Percentage': np.random.uniform(0, 25, n_rows).round(1),